@@ -1,5 +1,6 @@
 import math
-from typing import Tuple, Callable, List, Any, Optional
+from operator import attrgetter
+from typing import Tuple, Callable, List, Any, Optional, Dict
 
 from fakeredis import _msgs as msgs
 from fakeredis._command_args_parsing import extract_args
@@ -16,29 +17,66 @@ from fakeredis._commands import (
 from fakeredis._helpers import OK, SimpleError, casematch, Database, SimpleString
 
 
-def _lcs(s1: bytes, s2: bytes) -> Tuple[int, bytes, List[List[object]]]:
+# Translation table mapping every byte to b"0", used to build the LCS match masks
+_LCS_ZEROS = b"0" * 256
+
+
+def _lcs_length(s1: bytes, s2: bytes) -> int:
+    """Length of the longest common subsequence, using the bit-parallel algorithm (Hyyrö).
+
+    A DP row over s2 is kept as the bits of a single integer, so each character of s1
+    costs a handful of big-integer operations instead of a Python loop over s2.
+    """
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
+    # Bit i of matches[ch] is set iff s2[i] == ch
+    matches: Dict[int, int] = dict()
+    reversed_s2 = s2[::-1]
+    for ch in set(s2):
+        table = bytearray(_LCS_ZEROS)
+        table[ch] = 0x31
+        matches[ch] = int(reversed_s2.translate(table), 2)
+    mask = (1 << len(s2)) - 1
+    v = mask
+    for ch in s1:
+        u = v & matches.get(ch, 0)
+        v = ((v + u) | (v - u)) & mask
+    return len(s2) - bin(v).count("1")
+
+
+def _lcs(s1: bytes, s2: bytes) -> Tuple[int, bytes, List[List[Any]]]:
     l1 = len(s1)
     l2 = len(s2)
-
-    # Opt array to store the optimal solution value till ith and jth position for 2 strings
-    opt: List[List[int]] = [[0] * (l2 + 1) for _ in range(0, l1 + 1)]
-
-    # Pi array to store the direction when calculating the actual sequence
-    pi: List[List[int]] = [[0] * (l2 + 1) for _ in range(0, l1 + 1)]
-
-    # Algorithm to calculate the length of the longest common subsequence
-    for r in range(1, l1 + 1):
-        for c in range(1, l2 + 1):
-            if s1[r - 1] == s2[c - 1]:
-                opt[r][c] = opt[r - 1][c - 1] + 1
-                pi[r][c] = 0
-            elif opt[r][c - 1] >= opt[r - 1][c]:
-                opt[r][c] = opt[r][c - 1]
-                pi[r][c] = 1
+    if l1 == 0 or l2 == 0 or set(s1).isdisjoint(s2):
+        return 0, b"", []
+    if s1 == s2:
+        return l1, s1, [[[0, l1 - 1], [0, l1 - 1], l1]]
+
+    # Pi array to store the direction when calculating the actual sequence,
+    # as a flat (l1 + 1) x (l2 + 1) buffer with one byte per cell
+    width = l2 + 1
+    pi = bytearray((l1 + 1) * width)
+    pi_rows = memoryview(pi)
+
+    # Opt rows to store the optimal solution value till ith and jth position for 2 strings.
+    # Each row only depends on the previous one, so only two rows are kept.
+    opt_prev, opt_curr = [0] * width, [0] * width
+
+    # Algorithm to calculate the length of the longest common subsequence.
+    # Iterating over the strings yields their bytes directly, without indexing per cell.
+    for r, ch1 in enumerate(s1, 1):
+        pi_curr = pi_rows[r * width : (r + 1) * width]
+        for c, ch2 in enumerate(s2, 1):
+            if ch1 == ch2:
+                opt_curr[c] = opt_prev[c - 1] + 1
+            elif opt_curr[c - 1] >= opt_prev[c]:
+                opt_curr[c] = opt_curr[c - 1]
+                pi_curr[c] = 1
             else:
-                opt[r][c] = opt[r - 1][c]
-                pi[r][c] = 2
-    # Length of the longest common subsequence is saved at opt[n][m]
+                opt_curr[c] = opt_prev[c]
+                pi_curr[c] = 2
+        opt_prev, opt_curr = opt_curr, opt_prev
+    # Length of the longest common subsequence is saved at opt_prev[l2]
 
     # Algorithm to calculate the longest common subsequence using the Pi array
     # Also calculate the list of matches
@@ -48,26 +86,26 @@ def _lcs(s1: bytes, s2: bytes) -> Tuple[int, bytes, List[List[object]]]:
     s1ind, s2ind, curr_length = None, None, 0
 
     while r > 0 and c > 0:
-        if pi[r][c] == 0:
+        if pi[r * width + c] == 0:
             result = chr(s1[r - 1]) + result
             r -= 1
             c -= 1
             curr_length += 1
-        elif pi[r][c] == 2:
+        elif pi[r * width + c] == 2:
             r -= 1
         else:
             c -= 1
 
-        if pi[r][c] == 0 and curr_length == 1:
+        if pi[r * width + c] == 0 and curr_length == 1:
             s1ind = r
             s2ind = c
-        elif pi[r][c] > 0 and curr_length > 0:
+        elif pi[r * width + c] > 0 and curr_length > 0:
             matches.append([[r, s1ind], [c, s2ind], curr_length])
             s1ind, s2ind, curr_length = None, None, 0
     if curr_length:
-        matches.append([[s1ind, r], [s2ind, c], curr_length])
+        matches.append([[r, s1ind], [c, s2ind], curr_length])
 
-    return opt[l1][l2], result.encode(), matches
+    return opt_prev[l2], result.encode(), matches
 
 
 class StringCommandsMixin:
@@ -92,10 +130,11 @@ class StringCommandsMixin:
     @command((Key(bytes), bytes))
     def append(self, key: CommandItem, value: bytes) -> int:
         old = key.get(b"")
-        if len(old) + len(value) > MAX_STRING_SIZE:
+        new_len = len(old) + len(value)
+        if new_len > MAX_STRING_SIZE:
             raise SimpleError(msgs.STRING_OVERFLOW_MSG)
-        key.update(key.get(b"") + value)
-        return len(key.value)
+        key.update(old + value)
+        return new_len
 
     @command((Key(bytes),))
     def decr(self, key: CommandItem) -> int:
@@ -147,29 +186,30 @@ class StringCommandsMixin:
 
     @command(fixed=(Key(),), repeat=(Key(),))
     def mget(self, *keys: CommandItem) -> List[Optional[bytes]]:
-        return [key.value if isinstance(key.value, bytes) else None for key in keys]
+        return [value if type(value) is bytes else None for value in map(attrgetter("value"), keys)]
 
     @command((Key(), bytes), (Key(), bytes))
     def mset(self, *args: Any) -> SimpleString:
-        for i in range(0, len(args), 2):
-            args[i].value = args[i + 1]
+        for key, value in zip(args[::2], args[1::2]):
+            key.value = value
         return OK
 
     @command((Key(), bytes), (Key(), bytes))
     def msetnx(self, *args: Any) -> int:
-        for i in range(0, len(args), 2):
-            if args[i]:
-                return 0
-        for i in range(0, len(args), 2):
-            args[i].value = args[i + 1]
+        keys = args[::2]
+        if any(keys):
+            return 0
+        for key, value in zip(keys, args[1::2]):
+            key.value = value
         return 1
 
     @command((Key(), Int, bytes))
     def psetex(self, key: CommandItem, ms: int, value: bytes) -> SimpleString:
-        if ms <= 0 or self._db.time * 1000 + ms >= 2**63:
+        now = self._db.time
+        if ms <= 0 or now * 1000 + ms >= 2**63:
             raise SimpleError(msgs.INVALID_EXPIRE_MSG.format("psetex"))
         key.value = value
-        key.expireat = int(self._db.time + ms / 1000.0)
+        key.expireat = int(now + ms / 1000.0)
         return OK
 
     @command(name="SET", fixed=(Key(), bytes), repeat=(bytes,))
@@ -177,9 +217,10 @@ class StringCommandsMixin:
         (ex, px, exat, pxat, xx, nx, keepttl, get), _ = extract_args(
             args, ("+ex", "+px", "+exat", "+pxat", "xx", "nx", "keepttl", "get")
         )
-        if ex is not None and (ex <= 0 or (self._db.time + ex) * 1000 >= 2**63):
+        now = self._db.time
+        if ex is not None and (ex <= 0 or (now + ex) * 1000 >= 2**63):
             raise SimpleError(msgs.INVALID_EXPIRE_MSG.format("set"))
-        if px is not None and (px <= 0 or self._db.time * 1000 + px >= 2**63):
+        if px is not None and (px <= 0 or now * 1000 + px >= 2**63):
             raise SimpleError(msgs.INVALID_EXPIRE_MSG.format("set"))
         if exat is not None and (exat <= 0 or exat * 1000 >= 2**63):
             raise SimpleError(msgs.INVALID_EXPIRE_MSG.format("set"))
@@ -211,17 +252,18 @@ class StringCommandsMixin:
         if pxat is not None:
             key.expireat = pxat / 1000.0
         if ex is not None:
-            key.expireat = self._db.time + ex
+            key.expireat = now + ex
         if px is not None:
-            key.expireat = self._db.time + px / 1000.0
+            key.expireat = now + px / 1000.0
         return OK if not get else old_value
 
     @command((Key(), Int, bytes))
     def setex(self, key: CommandItem, seconds: int, value: bytes) -> SimpleString:
-        if seconds <= 0 or (self._db.time + seconds) * 1000 >= 2**63:
+        now = self._db.time
+        if seconds <= 0 or (now + seconds) * 1000 >= 2**63:
             raise SimpleError(msgs.INVALID_EXPIRE_MSG.format("setex"))
         key.value = value
-        key.expireat = int(self._db.time + seconds)
+        key.expireat = int(now + seconds)
         return OK
 
     @command((Key(), bytes))
@@ -239,11 +281,11 @@ class StringCommandsMixin:
             return len(key.get(b""))
         elif offset + len(value) > MAX_STRING_SIZE:
             raise SimpleError(msgs.STRING_OVERFLOW_MSG)
-        out = key.get(b"")
+        out = bytearray(key.get(b""))
         if len(out) < offset:
-            out += b"\x00" * (offset - len(out))
-        out = out[0:offset] + value + out[offset + len(value) :]
-        key.update(out)
+            out.extend(b"\x00" * (offset - len(out)))
+        out[offset : offset + len(value)] = value
+        key.update(bytes(out))
         return len(out)
 
     @command((Key(bytes),))
@@ -253,16 +295,17 @@ class StringCommandsMixin:
     @command((Key(bytes),), (bytes,))
     def getex(self, key: CommandItem, *args: bytes) -> Any:
         i, count_options, expire_time, diff = 0, 0, None, None
+        now = self._db.time
 
         while i < len(args):
             count_options += 1
             if casematch(args[i], b"ex") and i + 1 < len(args):
                 diff = Int.decode(args[i + 1])
-                expire_time = self._db.time + diff
+                expire_time = now + diff
                 i += 2
             elif casematch(args[i], b"px") and i + 1 < len(args):
                 diff = Int.decode(args[i + 1])
-                expire_time = (self._db.time * 1000 + diff) / 1000.0
+                expire_time = (now * 1000 + diff) / 1000.0
                 i += 2
             elif casematch(args[i], b"exat") and i + 1 < len(args):
                 expire_time = Int.decode(args[i + 1])
@@ -295,13 +338,13 @@ class StringCommandsMixin:
         )
         if arg_idx and arg_len:
             raise SimpleError(msgs.LCS_CANT_HAVE_BOTH_LEN_AND_IDX)
+        if arg_len:
+            return _lcs_length(s1, s2)
         lcs_len, lcs_val, matches = _lcs(s1, s2)
-        if not arg_idx and not arg_len:
+        if not arg_idx:
             return lcs_val
-        if arg_len:
-            return lcs_len
         arg_minmatchlen = arg_minmatchlen if arg_minmatchlen else 0
-        results = list(filter(lambda x: x[2] >= arg_minmatchlen, matches))
-        if not arg_withmatchlen:
-            results = list(map(lambda x: [x[0], x[1]], results))
+        results = [
+            match if arg_withmatchlen else [match[0], match[1]] for match in matches if match[2] >= arg_minmatchlen
+        ]
         return [b"matches", results, b"len", lcs_len]
@@ -399,6 +399,15 @@ class XStream:
         self._entries_added += 1
         return ts_seq.encode()
 
+    def extend(self, entries: Sequence[Tuple[Sequence[Union[bytes, int]], str]]) -> List[Optional[bytes]]:
+        """Add several entries to a stream, in order.
+
+        :param entries: List of (fields, entry_key) pairs, see `add`.
+        :returns: The keys of the added entries, None for each entry that was not added.
+        """
+        add = self.add
+        return [add(fields, entry_key) for fields, entry_key in entries]
+
     def __bool__(self):
         return True
 
@@ -1,8 +1,9 @@
 """Command mixin for emulating `redis-py`'s Count-min sketch functionality."""
 
-from typing import Optional, Tuple, List, Any
+from typing import Optional, Tuple, List, Any, Sequence
 
 import probables
+from probables.constants import INT32_T_MAX, INT32_T_MIN, INT64_T_MAX, INT64_T_MIN
 
 from fakeredis import _msgs as msgs
 from fakeredis._commands import command, CommandItem, Int, Key, Float
@@ -19,6 +20,36 @@ class CountMinSketch(probables.CountMinSketch):
     ):
         super().__init__(width=width, depth=depth, error_rate=error_rate, confidence=probability)
 
+    def query(self, items: Sequence[bytes]) -> List[int]:
+        """Estimated counts of `items`, equivalent to calling `check` for each of them."""
+        width, bins = self.width, self._bins
+        return [min(bins[val % width + i * width] for i, val in enumerate(self.hashes(item))) for item in items]
+
+    def join_weighted(self, second: "CountMinSketch", weight: int) -> None:
+        """Join `second` into this sketch `weight` times, in a single pass over the bins.
+
+        Saturates the same way as calling `join` `weight` times.
+        """
+        # Same compatibility check as `join`, done up front so it does not depend on the weight
+        if (
+            (self.width != second.width)
+            or (self.depth != second.depth)
+            or (self.hashes("test") != second.hashes("test"))
+        ):
+            raise probables.exceptions.CountMinSketchError("Unable to merge as the count-min sketches are mismatched")
+        if weight < 1:
+            return
+        if weight == 1:
+            self.join(second)
+            return
+        bins = self._bins
+        for i, value in enumerate(second._bins):
+            if bins[i] == INT32_T_MIN or bins[i] == INT32_T_MAX:
+                continue
+            bins[i] = max(INT32_T_MIN, min(INT32_T_MAX, bins[i] + weight * value))
+        elements_added = self.elements_added + weight * second.elements_added
+        self._CountMinSketch__elements_added = max(INT64_T_MIN, min(INT64_T_MAX, elements_added))
+
 
 class CMSCommandsMixin:
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -126,8 +157,7 @@ class CMSCommandsMixin:
             item = self._db.get(arg, None)
             if item is None or not isinstance(item.value, CountMinSketch):
                 raise SimpleError("CMS: key does not exist")
-            for _ in range(weights[i % len(weights)]):
-                dest_key.value.join(item.value)
+            dest_key.value.join_weighted(item.value, weights[i % len(weights)])
         return OK
 
     @command(
@@ -139,4 +169,5 @@ class CMSCommandsMixin:
     def cms_query(self, key: CommandItem, *items: bytes) -> List[int]:
         if key.value is None:
             raise SimpleError("CMS: key does not exist")
-        return [key.value.check(item) for item in items]
+        res: List[int] = key.value.query(items)
+        return res
@@ -1,6 +1,7 @@
 """Command mixin for emulating `redis-py`'s JSON functionality."""
 
 import copy
+import functools
 import json
 from json import JSONDecodeError
 from typing import Any, Union, Dict, List, Optional, Callable, Tuple, Type
@@ -18,7 +19,13 @@ from fakeredis.model import ZSet
 
 JsonType = Union[str, int, float, bool, None, Dict[str, Any], List[Any]]
 
+_ROOT = Root()
+_ROOT_PATHS = frozenset({b"$", "$", b".", "."})
+_JSON_ENCODER = json.JSONEncoder(default=str)
+_JSON_DECODER = json.JSONDecoder()
 
+
+@functools.lru_cache(maxsize=1024)
 def _format_path(path: Union[bytes, str]) -> str:
     path_str = path.decode() if isinstance(path, bytes) else path
     if path_str == ".":
@@ -31,7 +38,8 @@ def _format_path(path: Union[bytes, str]) -> str:
         return "$." + path_str
 
 
-def _parse_jsonpath(path: Union[str, bytes]) -> JSONPath:
+@functools.lru_cache(maxsize=1024)
+def _parse_jsonpath_cached(path: Union[str, bytes]) -> JSONPath:
     path_str: str = _format_path(path)
     try:
         return parse(path_str)
@@ -39,8 +47,14 @@ def _parse_jsonpath(path: Union[str, bytes]) -> JSONPath:
         raise helpers.SimpleError(msgs.JSON_PATH_DOES_NOT_EXIST.format(path_str))
 
 
+def _parse_jsonpath(path: Union[str, bytes]) -> JSONPath:
+    if path in _ROOT_PATHS:
+        return _ROOT
+    return _parse_jsonpath_cached(path)
+
+
 def _path_is_root(path: JSONPath) -> bool:
-    return path == Root()  # type: ignore
+    return path is _ROOT or path == _ROOT
 
 
 def _dict_deep_merge(source: JsonType, destination: Dict[str, Any]) -> Dict[str, Any]:
@@ -69,7 +83,7 @@ class JSONObject:
     def decode(cls, value: bytes) -> Any:
         """Deserialize the supplied bytes into a valid Python object."""
         try:
-            return json.loads(value)
+            return _JSON_DECODER.decode(value.decode() if isinstance(value, bytes) else value)
         except JSONDecodeError:
             raise helpers.SimpleError(cls.DECODE_ERROR)
 
@@ -77,7 +91,7 @@ class JSONObject:
     def encode(cls, value: Any) -> Optional[bytes]:
         """Serialize the supplied Python object into a valid, JSON-formatted
         byte-encoded string."""
-        return json.dumps(value, default=str).encode() if value is not None else None
+        return _JSON_ENCODER.encode(value).encode() if value is not None else None
 
 
 def _json_write_iterate(
@@ -197,10 +211,10 @@ class JSONCommandsMixin:
         if key.value is None:
             return 0
 
-        path = _parse_jsonpath(path_str)
-        if _path_is_root(path):
+        if path_str in _ROOT_PATHS:
             delete_keys(key)
             return 1
+        path = _parse_jsonpath(path_str)
         curr_value = copy.deepcopy(key.value)
 
         found_matches = path.find(curr_value)
@@ -219,12 +233,13 @@ class JSONCommandsMixin:
         path = _parse_jsonpath(path_str)
         if key.value is not None and (type(key.value) is not dict) and not _path_is_root(path):
             raise helpers.SimpleError(msgs.JSON_WRONG_REDIS_TYPE)
-        old_value = path.find(key.value)
         (nx, xx), _ = extract_args(args, ("nx", "xx"))
         if xx and nx:
             raise helpers.SimpleError(msgs.SYNTAX_ERROR_MSG)
-        if (nx and old_value) or (xx and not old_value):
-            return None
+        if nx or xx:
+            old_value = path.find(key.value)
+            if (nx and old_value) or (xx and not old_value):
+                return None
         new_value = path.update_or_create(key.value, value)
         key.update(new_value)
         return helpers.OK
@@ -254,8 +269,8 @@ class JSONCommandsMixin:
         paths = [arg for arg in args if not helpers.casematch(b"noescape", arg)]
         no_wrapping_array = len(paths) == 1 and paths[0][0] == ord(b".")
 
-        formatted_paths: List[str] = [_format_path(arg) for arg in args if not helpers.casematch(b"noescape", arg)]
-        path_values = [self._get_single(key, path, len(formatted_paths) > 1) for path in formatted_paths]
+        formatted_paths: List[str] = [_format_path(path) for path in paths]
+        path_values = [self._get_single(key, path, len(paths) > 1) for path in paths]
 
         # Emulate the behavior of `redis-py`:
         #   - if only one path was supplied => return a single value
@@ -264,7 +279,16 @@ class JSONCommandsMixin:
             return JSONObject.encode(path_values[0])
         if len(path_values) == 1:
             return JSONObject.encode(path_values)
-        return JSONObject.encode(dict(zip(formatted_paths, path_values)))
+        # Encode the {path: value} object piece by piece instead of building an intermediate dict.
+        # Repeated paths are emitted once, at their first position, the same as a dict would.
+        seen = set()
+        members = []
+        for path, value in zip(formatted_paths, path_values):
+            if path in seen:
+                continue
+            seen.add(path)
+            members.append(f"{_JSON_ENCODER.encode(path)}: {_JSON_ENCODER.encode(value)}")
+        return ("{" + ", ".join(members) + "}").encode()
 
     @command(
         name="JSON.MGET",
@@ -53,11 +53,13 @@ def _fake_server(request, real_server_details: ServerDetails) -> fakeredis.FakeS
 @pytest_asyncio.fixture
 def r(request, create_redis: Callable[[int], redis.Redis]) -> redis.Redis:
     rconn = create_redis(db=2)
-    connected = request.node.get_closest_marker("disconnected") is None
-    if connected:
+    # Fake connections get a new, empty FakeServer for every test, so only the real server needs flushing
+    flush = request.node.get_closest_marker("real") is not None
+    flush = flush and request.node.get_closest_marker("disconnected") is None
+    if flush:
         rconn.flushall()
     yield rconn
-    if connected:
+    if flush:
         rconn.flushall()
     if hasattr(r, "close"):
         rconn.close()  # Older versions of redis-py don't have this method
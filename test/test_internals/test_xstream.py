@@ -6,12 +6,16 @@ from fakeredis.model import XStream, StreamRangeTest
 @pytest.mark.fake
 def test_xstream():
     stream = XStream()
-    stream.add([0, 0, 1, 1, 2, 2, 3, 3], "0-1")
-    stream.add([1, 1, 2, 2, 3, 3, 4, 4], "1-2")
-    stream.add([2, 2, 3, 3, 4, 4], "1-3")
-    stream.add([3, 3, 4, 4], "2-1")
-    stream.add([3, 3, 4, 4], "2-2")
-    stream.add([3, 3, 4, 4], "3-1")
+    assert stream.extend(
+        [
+            ([0, 0, 1, 1, 2, 2, 3, 3], "0-1"),
+            ([1, 1, 2, 2, 3, 3, 4, 4], "1-2"),
+            ([2, 2, 3, 3, 4, 4], "1-3"),
+            ([3, 3, 4, 4], "2-1"),
+            ([3, 3, 4, 4], "2-2"),
+            ([3, 3, 4, 4], "3-1"),
+        ]
+    ) == [b"0-1", b"1-2", b"1-3", b"2-1", b"2-2", b"3-1"]
     assert stream.add([3, 3, 4, 4], "4-*") == b"4-0"
     assert stream.last_item_key() == b"4-0"
     assert stream.add([3, 3, 4, 4], "4-*-*") is None
@@ -28,6 +32,9 @@ def test_xstream():
     assert stream.find_index_key_as_str("2-1") == (3, True)
     assert stream.find_index_key_as_str("1-4") == (3, False)
 
+    assert stream.extend([([5, 5], "3-0"), ([5, 5], "5-*")]) == [None, b"5-0"]
+    assert len(stream) == 8
+
     lst = stream.irange(StreamRangeTest.decode(b"0-2"), StreamRangeTest.decode(b"3-0"))
     assert len(lst) == 4
 
@@ -18,8 +18,8 @@ def test_hstrlen(r: redis.Redis):
 
 
 def test_hset_then_hget(r: redis.Redis):
-    assert r.hset("foo", "key", "value") == 1
-    assert r.hget("foo", "key") == b"value"
+    assert r.hset(b"foo", b"key", b"value") == 1
+    assert r.hget(b"foo", b"key") == b"value"
 
 
 def test_hset_update(r: redis.Redis):
@@ -27,29 +27,39 @@ def test_hset_update(r: redis.Redis):
     assert r.hset("foo", "key", "value") == 0
 
 
-def test_hset_wrong_type(r: redis.Redis):
+@pytest.mark.parametrize(
+    "method,args",
+    [
+        pytest.param("hset", ("key", "value"), id="hset"),
+        pytest.param("hgetall", (), id="hgetall"),
+        pytest.param("hexists", ("key",), id="hexists"),
+        pytest.param("hkeys", (), id="hkeys"),
+        pytest.param("hlen", (), id="hlen"),
+        pytest.param("hvals", (), id="hvals"),
+        pytest.param("hmget", ("key1", "key2"), id="hmget"),
+        pytest.param("hdel", ("key",), id="hdel"),
+        pytest.param("hincrby", ("key", 2), id="hincrby"),
+        pytest.param("hincrbyfloat", ("key", 0.1), id="hincrbyfloat"),
+        pytest.param("hmset", ({"key": "value"},), id="hmset"),
+    ],
+)
+def test_hash_commands_wrong_type(r: redis.Redis, method: str, args: tuple):
     r.zadd("foo", {"bar": 1})
     with pytest.raises(redis.ResponseError):
-        r.hset("foo", "key", "value")
+        getattr(r, method)("foo", *args)
 
 
 def test_hgetall(r: redis.Redis):
-    assert r.hset("foo", "k1", "v1") == 1
-    assert r.hset("foo", "k2", "v2") == 1
-    assert r.hset("foo", "k3", "v3") == 1
-    assert r.hgetall("foo") == {b"k1": b"v1", b"k2": b"v2", b"k3": b"v3"}
+    assert r.hset(b"foo", b"k1", b"v1") == 1
+    assert r.hset(b"foo", b"k2", b"v2") == 1
+    assert r.hset(b"foo", b"k3", b"v3") == 1
+    assert r.hgetall(b"foo") == {b"k1": b"v1", b"k2": b"v2", b"k3": b"v3"}
 
 
 def test_hgetall_empty_key(r: redis.Redis):
     assert r.hgetall("foo") == {}
 
 
-def test_hgetall_wrong_type(r: redis.Redis):
-    r.zadd("foo", {"bar": 1})
-    with pytest.raises(redis.ResponseError):
-        r.hgetall("foo")
-
-
 def test_hexists(r: redis.Redis):
     r.hset("foo", "bar", "v1")
     assert r.hexists("foo", "bar") == 1
@@ -57,23 +67,11 @@ def test_hexists(r: redis.Redis):
     assert r.hexists("bar", "bar") == 0
 
 
-def test_hexists_wrong_type(r: redis.Redis):
-    r.zadd("foo", {"bar": 1})
-    with pytest.raises(redis.ResponseError):
-        r.hexists("foo", "key")
-
-
 def test_hkeys(r: redis.Redis):
     r.hset("foo", "k1", "v1")
     r.hset("foo", "k2", "v2")
-    assert set(r.hkeys("foo")) == {b"k1", b"k2"}
-    assert set(r.hkeys("bar")) == set()
-
-
-def test_hkeys_wrong_type(r: redis.Redis):
-    r.zadd("foo", {"bar": 1})
-    with pytest.raises(redis.ResponseError):
-        r.hkeys("foo")
+    assert sorted(r.hkeys("foo")) == [b"k1", b"k2"]
+    assert r.hkeys("bar") == []
 
 
 def test_hlen(r: redis.Redis):
@@ -82,23 +80,11 @@ def test_hlen(r: redis.Redis):
     assert r.hlen("foo") == 2
 
 
-def test_hlen_wrong_type(r: redis.Redis):
-    r.zadd("foo", {"bar": 1})
-    with pytest.raises(redis.ResponseError):
-        r.hlen("foo")
-
-
 def test_hvals(r: redis.Redis):
     r.hset("foo", "k1", "v1")
     r.hset("foo", "k2", "v2")
-    assert set(r.hvals("foo")) == {b"v1", b"v2"}
-    assert set(r.hvals("bar")) == set()
-
-
-def test_hvals_wrong_type(r: redis.Redis):
-    r.zadd("foo", {"bar": 1})
-    with pytest.raises(redis.ResponseError):
-        r.hvals("foo")
+    assert sorted(r.hvals("foo")) == [b"v1", b"v2"]
+    assert r.hvals("bar") == []
 
 
 def test_hmget(r: redis.Redis):
@@ -116,12 +102,6 @@ def test_hmget(r: redis.Redis):
     assert r.hmget("foo", "k1", "k500") == [b"v1", None]
 
 
-def test_hmget_wrong_type(r: redis.Redis):
-    r.zadd("foo", {"bar": 1})
-    with pytest.raises(redis.ResponseError):
-        r.hmget("foo", "key1", "key2")
-
-
 def test_hdel(r: redis.Redis):
     r.hset("foo", "k1", "v1")
     r.hset("foo", "k2", "v2")
@@ -137,12 +117,6 @@ def test_hdel(r: redis.Redis):
     assert r.hdel("foo", "k2", "k3") == 0
 
 
-def test_hdel_wrong_type(r: redis.Redis):
-    r.zadd("foo", {"bar": 1})
-    with pytest.raises(redis.ResponseError):
-        r.hdel("foo", "key")
-
-
 def test_hincrby(r: redis.Redis):
     r.hset("foo", "counter", 0)
     assert r.hincrby("foo", "counter") == 1
@@ -162,12 +136,6 @@ def test_hincrby_with_range_param(r: redis.Redis):
     assert r.hincrby("foo", "counter", 2) == 6
 
 
-def test_hincrby_wrong_type(r: redis.Redis):
-    r.zadd("foo", {"bar": 1})
-    with pytest.raises(redis.ResponseError):
-        r.hincrby("foo", "key", 2)
-
-
 def test_hincrbyfloat(r: redis.Redis):
     r.hset("foo", "counter", 0.0)
     assert r.hincrbyfloat("foo", "counter") == 1.0
@@ -181,10 +149,13 @@ def test_hincrbyfloat_with_no_starting_value(r: redis.Redis):
     assert r.hincrbyfloat("foo", "counter") == 3.0
 
 
+_APPROX_01, _APPROX_02, _APPROX_03 = pytest.approx(0.1), pytest.approx(0.2), pytest.approx(0.3)
+
+
 def test_hincrbyfloat_with_range_param(r: redis.Redis):
-    assert r.hincrbyfloat("foo", "counter", 0.1) == pytest.approx(0.1)
-    assert r.hincrbyfloat("foo", "counter", 0.1) == pytest.approx(0.2)
-    assert r.hincrbyfloat("foo", "counter", 0.1) == pytest.approx(0.3)
+    assert r.hincrbyfloat("foo", "counter", 0.1) == _APPROX_01
+    assert r.hincrbyfloat("foo", "counter", 0.1) == _APPROX_02
+    assert r.hincrbyfloat("foo", "counter", 0.1) == _APPROX_03
 
 
 def test_hincrbyfloat_on_non_float_value_raises_error(r: redis.Redis):
@@ -198,12 +169,6 @@ def test_hincrbyfloat_with_non_float_amount_raises_error(r: redis.Redis):
         r.hincrbyfloat("foo", "counter", "cat")
 
 
-def test_hincrbyfloat_wrong_type(r: redis.Redis):
-    r.zadd("foo", {"bar": 1})
-    with pytest.raises(redis.ResponseError):
-        r.hincrbyfloat("foo", "key", 0.1)
-
-
 def test_hincrbyfloat_precision(r: redis.Redis):
     x = 1.23456789123456789
     assert r.hincrbyfloat("foo", "bar", x) == x
@@ -227,12 +192,6 @@ def test_hmset_redispy4(r: redis.Redis):
     assert r.hmset("foo", {"k2": "v2", "k3": "v3"}) is True
 
 
-def test_hmset_wrong_type(r: redis.Redis):
-    r.zadd("foo", {"bar": 1})
-    with pytest.raises(redis.ResponseError):
-        r.hmset("foo", {"key": "value"})
-
-
 def test_empty_hash(r: redis.Redis):
     r.hset("foo", "bar", "baz")
     r.hdel("foo", "bar")
@@ -242,17 +201,15 @@ def test_empty_hash(r: redis.Redis):
 def test_hset_removing_last_field_delete_key(r: redis.Redis):
     r.hset(b"3L", b"f1", b"v1")
     r.hdel(b"3L", b"f1")
-    assert r.keys("*") == []
+    assert r.exists(b"3L") == 0
 
 
 def test_hscan(r: redis.Redis):
     # Set up the data
     name = "hscan-test"
-    for ix in range(20):
-        k = "key:%s" % ix
-        v = "result:%s" % ix
-        r.hset(name, k, v)
-    expected = r.hgetall(name)
+    mapping = {f"key:{ix}".encode(): f"result:{ix}".encode() for ix in range(20)}
+    r.hset(name, mapping=mapping)
+    expected = mapping
     assert len(expected) == 20  # Ensure we know what we're testing
 
     # Test that we page through the results and get everything out
@@ -264,28 +221,19 @@ def test_hscan(r: redis.Redis):
     assert expected == results
 
     # Test the iterator version
-    results = {}
-    for key, val in r.hscan_iter(name, count=6):
-        results[key] = val
-    assert expected == results
+    assert dict(r.hscan_iter(name, count=6)) == expected
 
     # Now test that the MATCH functionality works
+    expected = {k: mapping[k] for k in (b"key:7", b"key:17")}
     results = {}
     cursor = "0"
     while cursor != 0:
         cursor, data = r.hscan(name, cursor, match="*7", count=100)
         results.update(data)
-    assert b"key:7" in results
-    assert b"key:17" in results
-    assert len(results) == 2
+    assert results == expected
 
     # Test the match on iterator
-    results = {}
-    for key, val in r.hscan_iter(name, match="*7"):
-        results[key] = val
-    assert b"key:7" in results
-    assert b"key:17" in results
-    assert len(results) == 2
+    assert dict(r.hscan_iter(name, match="*7")) == expected
 
 
 def test_hrandfield(r: redis.Redis):
@@ -16,7 +16,7 @@ def test_sscan_delete_key_while_scanning_should_not_returns_it_in_scan(r: redis.
     cursor, keys = r.sscan(name, 0)
     assert len(keys) < len(all_keys_set)
 
-    key_to_remove = next(x for x in all_keys_set if x not in keys)
+    key_to_remove = next(iter(all_keys_set.difference(keys)))
     assert r.srem(name, key_to_remove) == 1
     assert not r.sismember(name, key_to_remove)
     while cursor != 0:
@@ -37,7 +37,7 @@ def test_hscan_delete_key_while_scanning_should_not_returns_it_in_scan(r: redis.
     cursor, keys = r.hscan(name, 0)
     assert len(keys) < len(all_keys_dict)
 
-    key_to_remove = next(x for x in all_keys_dict if x not in keys)
+    key_to_remove = next(iter(all_keys_dict.keys() - keys.keys()))
     assert r.hdel(name, key_to_remove) == 1
     assert r.hget(name, key_to_remove) is None
     while cursor != 0:
@@ -56,7 +56,7 @@ def test_scan_delete_unseen_key_while_scanning_should_not_returns_it_in_scan(r:
 
     cursor, keys = r.scan()
 
-    key_to_remove = next(x for x in all_keys_dict if x not in keys)
+    key_to_remove = next(iter(all_keys_dict.keys() - keys))
     assert r.delete(key_to_remove) == 1
     assert r.get(key_to_remove) is None
     while cursor != 0:
@@ -14,19 +14,26 @@ def get_ids(results):
 
 
 def add_items(r: redis.Redis, stream: str, n: int):
-    id_list = list()
-    for i in range(n):
-        id_list.append(r.xadd(stream, {"k": i}))
-    return id_list
+    with r.pipeline(transaction=False) as p:
+        for i in range(n):
+            p.xadd(stream, {"k": i})
+        return p.execute()
+
+
+@testtools.fake_only
+def test_xadd_uses_current_time(r: redis.Redis, mocker):
+    fake_time = mocker.patch("time.time")
+    fake_time.return_value = 1234567890.1234567
+    assert r.xadd("stream", {"some": "other"}) == b"1234567890123-0"
+    assert r.xadd("stream", {"add": "more"}) == b"1234567890123-1"
+    fake_time.return_value = 1234567891.0
+    assert r.xadd("stream", {"add": "more"}) == b"1234567891000-0"
 
 
 def test_xadd_redis__green(r: redis.Redis):
     stream = "stream"
-    before = int(1000 * time.time())
     m1 = r.xadd(stream, {"some": "other"})
     ts1, seq1 = m1.decode().split("-")
-    after = int(1000 * time.time()) + 1
-    assert before <= int(ts1) <= after
     seq1 = int(seq1)
     m2 = r.xadd(stream, {"add": "more"}, id=f"{ts1}-{seq1 + 1}")
     ts2, seq2 = m2.decode().split("-")
@@ -138,16 +145,15 @@ def test_xadd_nomkstream(r: redis.Redis):
     assert r.xlen(stream) == 3
 
 
-def _add_to_stream(r: redis.Redis, stream_name: str, n: int):
-    res = []
-    for _ in range(n):
-        res.append(r.xadd(stream_name, {"foo": "bar"}))
-    return res
+@pytest.fixture
+def populated_stream(r: redis.Redis):
+    """A stream with four entries, for tests that only read it."""
+    stream = "stream"
+    return stream, add_items(r, stream, 4)
 
 
-def test_xrevrange(r: redis.Redis):
-    stream = "stream"
-    m1, m2, m3, m4 = _add_to_stream(r, stream, 4)
+def test_xrevrange(r: redis.Redis, populated_stream):
+    stream, (m1, m2, m3, m4) = populated_stream
 
     results = r.xrevrange(stream, max=m4)
     assert get_ids(results) == [m4, m3, m2, m1]
@@ -162,9 +168,8 @@ def test_xrevrange(r: redis.Redis):
     assert get_ids(results) == [m4]
 
 
-def test_xrevrange_exclusive(r: redis.Redis):
-    stream = "stream"
-    m1, m2, m3, m4 = _add_to_stream(r, stream, 4)
+def test_xrevrange_exclusive(r: redis.Redis, populated_stream):
+    stream, (m1, m2, m3, m4) = populated_stream
 
     def _exc(key: bytes) -> bytes:
         return b"(" + key
@@ -182,7 +187,7 @@ def test_xrevrange_exclusive(r: redis.Redis):
     assert get_ids(results) == [m4, m3, m2]
 
 
-def test_xrange(r: redis.Redis):
+def test_xrange(r: redis.Redis, populated_stream):
     m = r.xadd("stream1", {"foo": "bar"})
     assert r.xrange("stream1") == [
         (m, {b"foo": b"bar"}),
@@ -195,9 +200,7 @@ def test_xrange(r: redis.Redis):
         (m, {b"field": b"value", b"foo": b"bar"}),
     ]
 
-    stream = "stream"
-    m1, m2, m3, m4 = _add_to_stream(r, stream, 4)
-
+    stream, (m1, m2, m3, m4) = populated_stream
     results = r.xrange(stream, min=m1)
     assert get_ids(results) == [m1, m2, m3, m4]
 
@@ -240,21 +243,18 @@ def test_xread(r: redis.Redis):
     stream = "stream"
     m1 = r.xadd(stream, {"foo": "bar"})
     m2 = r.xadd(stream, {"bing": "baz"})
+    msg1 = get_stream_message(r, stream, m1)
+    msg2 = get_stream_message(r, stream, m2)
 
-    expected = [
-        [
-            stream.encode(),
-            [get_stream_message(r, stream, m1), get_stream_message(r, stream, m2)],
-        ]
-    ]
+    expected = [[stream.encode(), [msg1, msg2]]]
     # xread starting at 0 returns both messages
     assert r.xread(streams={stream: 0}) == expected
 
-    expected = [[stream.encode(), [get_stream_message(r, stream, m1)]]]
+    expected = [[stream.encode(), [msg1]]]
     # xread starting at 0 and count=1 returns only the first message
     assert r.xread(streams={stream: 0}, count=1) == expected
 
-    expected = [[stream.encode(), [get_stream_message(r, stream, m2)]]]
+    expected = [[stream.encode(), [msg2]]]
     # xread starting at m1 returns only the second message
     assert r.xread(streams={stream: m1}) == expected
 
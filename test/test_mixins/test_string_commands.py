@@ -125,6 +125,19 @@ def test_incr_bad_type(r: redis.Redis):
         r.incr("foo2", 15)
 
 
+def test_incr_after_value_changed(r: redis.Redis):
+    assert r.incr("foo") == 1
+    assert r.append("foo", "0") == 2
+    assert r.incr("foo") == 11
+    r.setrange("foo", 0, "5")
+    assert r.incr("foo") == 52
+    r.set("foo", "bar")
+    with pytest.raises(redis.ResponseError):
+        r.incr("foo")
+    r.set("foo", 7)
+    assert r.decr("foo") == 6
+
+
 def test_incr_with_float(r: redis.Redis):
     with pytest.raises(redis.ResponseError):
         r.incr("foo", 2.0)
@@ -542,8 +555,30 @@ def test_lcs(r: redis.Redis):
         6,
     ]
     assert r.lcs("key1", "key2", idx=True, minmatchlen=3) == [b"matches", [[[4, 7], [5, 8]]], b"len", 6]
+    assert r.lcs("key1", "key2", idx=True, withmatchlen=True) == [
+        b"matches",
+        [[[4, 7], [5, 8], 4], [[2, 3], [0, 1], 2]],
+        b"len",
+        6,
+    ]
 
     with pytest.raises(redis.ResponseError):
         assert r.lcs("key1", "key2", len=True, idx=True)
     with pytest.raises(redis.ResponseError):
         raw_command(r, "lcs", "key1", "key2", "not_supported_arg")
+
+
+@pytest.mark.min_server("7")
+def test_lcs_identical_and_empty(r: redis.Redis):
+    r.mset({"key1": "mytext", "key2": "mytext"})
+    assert r.lcs("key1", "key2") == b"mytext"
+    assert r.lcs("key1", "key2", len=True) == 6
+    assert r.lcs("key1", "key2", idx=True, withmatchlen=True) == [b"matches", [[[0, 5], [0, 5], 6]], b"len", 6]
+
+    assert r.lcs("key1", "missing") == b""
+    assert r.lcs("key1", "missing", len=True) == 0
+    assert r.lcs("key1", "missing", idx=True) == [b"matches", [], b"len", 0]
+
+    r.set("key3", "ABCD")
+    assert r.lcs("key1", "key3") == b""
+    assert r.lcs("key1", "key3", idx=True) == [b"matches", [], b"len", 0]
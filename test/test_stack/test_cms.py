@@ -105,11 +105,23 @@ def test_cms_info(r: redis.Redis):
     assert info.width == 1000
     assert info.depth == 5
     assert info.count == 17
+    assert r.cms().info("C").count == 2 * 17 + 3 * 6
 
     with pytest.raises(redis.exceptions.ResponseError, match="CMS: key does not exist"):
         r.cms().info("noexist")
 
 
+@testtools.fake_only
+def test_cms_merge_weighted_saturates(r: redis.Redis):
+    assert r.cms().initbydim("A", 1000, 5)
+    assert r.cms().initbydim("C", 1000, 5)
+
+    assert r.cms().incrby("A", ["foo"], [2**31 - 10]) == [2**31 - 10]
+    assert r.cms().merge("C", 1, ["A"], ["3"])
+    assert r.cms().query("C", "foo") == [2**31 - 1]
+    assert r.cms().info("C").count == 3 * (2**31 - 10)
+
+
 @pytest.mark.xfail(reason="Bug in pyprobables")
 @pytest.mark.unsupported_server_types("dragonfly")
 def test_cms_merge_fail(r: redis.Redis):
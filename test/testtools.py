@@ -1,4 +1,6 @@
+import functools
 import importlib.util
+from types import MappingProxyType
 
 import pytest
 import redis
@@ -7,8 +9,10 @@ from packaging.version import Version
 REDIS_VERSION = Version(redis.__version__)
 
 
+@functools.lru_cache(maxsize=8)
 def key_val_dict(size=100):
-    return {f"key:{i}".encode(): f"val:{i}".encode() for i in range(size)}
+    """Read-only mapping of `size` key:<i> -> val:<i> pairs, built once per size."""
+    return MappingProxyType({f"key:{i}".encode(): f"val:{i}".encode() for i in range(size)})
 
 
 def raw_command(r: redis.Redis, *args):